@@ -38,37 +38,69 @@ VIDEO_ONLY_PATH = os.path.join(TEST_DATA_DIR, 'video_0.mov')
 CTX = cpu(0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bbb_video():
     """VideoReader for big_buck_bunny.mp4."""
     return VideoReader(BBB_PATH, ctx=CTX)
 
 
 @pytest.fixture
+def bbb_video_mutable():
+    """Per-test VideoReader for big_buck_bunny.mp4, for tests that move the decode position."""
+    return VideoReader(BBB_PATH, ctx=CTX)
+
+
+@pytest.fixture(scope="session")
 def bbb_audio():
     """AudioReader for big_buck_bunny.mp4 (mono)."""
     return AudioReader(BBB_PATH, ctx=CTX, mono=True)
 
 
 @pytest.fixture
+def bbb_audio_mutable():
+    """Per-test AudioReader for big_buck_bunny.mp4 (mono), for tests that modify reader state."""
+    return AudioReader(BBB_PATH, ctx=CTX, mono=True)
+
+
+@pytest.fixture(scope="session")
 def bbb_audio_stereo():
     """AudioReader for big_buck_bunny.mp4 (stereo)."""
     return AudioReader(BBB_PATH, ctx=CTX, mono=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bbb_av():
     """AVReader for big_buck_bunny.mp4."""
     return AVReader(BBB_PATH, ctx=CTX)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pancake_video():
     """VideoReader for flipping_a_pancake.mkv."""
     return VideoReader(PANCAKE_PATH, ctx=CTX)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def unordered_video():
+    """VideoReader for unordered.mov (out-of-order PTS)."""
+    return VideoReader(UNORDERED_PATH, ctx=CTX)
+
+
+@pytest.fixture(scope="session")
 def mp3_audio():
     """AudioReader for the MP3 test file (mono, 44100 Hz)."""
     return AudioReader(MP3_PATH, ctx=CTX, mono=True)
+
+
+@pytest.fixture(scope="session")
+def bbb_bytes():
+    """Raw contents of big_buck_bunny.mp4, for file-like object tests."""
+    with open(BBB_PATH, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def mp3_bytes():
+    """Raw contents of the MP3 test file, for file-like object tests."""
+    with open(MP3_PATH, 'rb') as f:
+        return f.read()
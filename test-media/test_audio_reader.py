@@ -116,18 +116,16 @@ class TestAudioReaderBatch:
 # ---------------------------------------------------------------------------
 
 class TestAudioReaderResample:
-    def test_resample_lower(self):
+    def test_resample_lower(self, bbb_audio):
         ar = AudioReader(BBB_PATH, ctx=CTX, sample_rate=11025, mono=True)
-        original = AudioReader(BBB_PATH, ctx=CTX, mono=True)
         # Resampled should have roughly half the samples
-        ratio = original.shape[1] / ar.shape[1]
+        ratio = bbb_audio.shape[1] / ar.shape[1]
         assert 1.8 < ratio < 2.2
 
-    def test_resample_higher(self):
+    def test_resample_higher(self, bbb_audio):
         ar = AudioReader(BBB_PATH, ctx=CTX, sample_rate=44100, mono=True)
-        original = AudioReader(BBB_PATH, ctx=CTX, mono=True)
         # Resampled should have roughly double the samples
-        ratio = ar.shape[1] / original.shape[1]
+        ratio = ar.shape[1] / bbb_audio.shape[1]
         assert 1.8 < ratio < 2.2
 
     def test_resample_preserves_channels(self):
@@ -140,13 +138,11 @@ class TestAudioReaderResample:
 # ---------------------------------------------------------------------------
 
 class TestAudioReaderChannels:
-    def test_stereo_to_mono(self):
-        ar_stereo = AudioReader(BBB_PATH, ctx=CTX, mono=False)
-        ar_mono = AudioReader(BBB_PATH, ctx=CTX, mono=True)
-        assert ar_stereo.shape[0] == 2
-        assert ar_mono.shape[0] == 1
+    def test_stereo_to_mono(self, bbb_audio_stereo, bbb_audio):
+        assert bbb_audio_stereo.shape[0] == 2
+        assert bbb_audio.shape[0] == 1
         # Same number of samples per channel
-        assert ar_stereo.shape[1] == ar_mono.shape[1]
+        assert bbb_audio_stereo.shape[1] == bbb_audio.shape[1]
 
 
 # ---------------------------------------------------------------------------
@@ -167,7 +163,7 @@ class TestAudioReaderValues:
         """Audio should not be entirely silent."""
         # Sample from middle of file where there should be audio
         samples = bbb_audio[100000:200000].asnumpy()
-        assert np.any(samples != 0)
+        assert samples.any()
 
 
 # ---------------------------------------------------------------------------
@@ -175,9 +171,9 @@ class TestAudioReaderValues:
 # ---------------------------------------------------------------------------
 
 class TestAudioReaderPadding:
-    def test_add_padding(self, bbb_audio):
-        original_samples = bbb_audio.shape[1]
-        num_padding = bbb_audio.add_padding()
+    def test_add_padding(self, bbb_audio_mutable):
+        original_samples = bbb_audio_mutable.shape[1]
+        num_padding = bbb_audio_mutable.add_padding()
         # After padding, total samples should increase by padding amount
         # (add_padding modifies internal array, not shape property)
         assert num_padding >= 0
@@ -188,18 +184,16 @@ class TestAudioReaderPadding:
 # ---------------------------------------------------------------------------
 
 class TestAudioReaderBytesIO:
-    def test_read_from_bytes_io(self):
-        with open(BBB_PATH, 'rb') as f:
-            ar = AudioReader(f, ctx=CTX, mono=True)
-            assert ar.shape[0] == 1
-            assert ar.shape[1] > 0
+    def test_read_from_bytes_io(self, bbb_bytes):
+        ar = AudioReader(io.BytesIO(bbb_bytes), ctx=CTX, mono=True)
+        assert ar.shape[0] == 1
+        assert ar.shape[1] > 0
 
-    def test_bytes_io_matches_file(self, bbb_audio):
-        with open(BBB_PATH, 'rb') as f:
-            ar_bio = AudioReader(f, ctx=CTX, mono=True)
-            file_samples = bbb_audio[0:1000].asnumpy()
-            bio_samples = ar_bio[0:1000].asnumpy()
-            assert np.allclose(file_samples, bio_samples)
+    def test_bytes_io_matches_file(self, bbb_audio, bbb_bytes):
+        ar_bio = AudioReader(io.BytesIO(bbb_bytes), ctx=CTX, mono=True)
+        file_samples = bbb_audio[0:1000].asnumpy()
+        bio_samples = ar_bio[0:1000].asnumpy()
+        assert np.allclose(file_samples, bio_samples)
 
 
 # ---------------------------------------------------------------------------
@@ -259,19 +253,17 @@ class TestAudioReaderMP3:
     def test_mp3_not_silent(self, mp3_audio):
         # Sample from well into the file
         samples = mp3_audio[500000:600000].asnumpy()
-        assert np.any(samples != 0)
+        assert samples.any()
 
     def test_mp3_samples_are_float(self, mp3_audio):
         samples = mp3_audio[0:100].asnumpy()
         assert samples.dtype in (np.float32, np.float64)
 
-    def test_mp3_resample(self):
+    def test_mp3_resample(self, mp3_audio):
         ar = AudioReader(MP3_PATH, ctx=CTX, sample_rate=22050, mono=True)
-        original = AudioReader(MP3_PATH, ctx=CTX, mono=True)
-        ratio = original.shape[1] / ar.shape[1]
+        ratio = mp3_audio.shape[1] / ar.shape[1]
         assert 1.8 < ratio < 2.2
 
-    def test_mp3_bytes_io(self, mp3_audio):
-        with open(MP3_PATH, 'rb') as f:
-            ar_bio = AudioReader(f, ctx=CTX, mono=True)
-            assert ar_bio.shape == mp3_audio.shape
+    def test_mp3_bytes_io(self, mp3_audio, mp3_bytes):
+        ar_bio = AudioReader(io.BytesIO(mp3_bytes), ctx=CTX, mono=True)
+        assert ar_bio.shape == mp3_audio.shape
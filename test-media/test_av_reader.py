@@ -1,4 +1,6 @@
 """Tests for decord.AVReader using big_buck_bunny.mp4."""
+import io
+
 import numpy as np
 import pytest
 
@@ -130,7 +132,7 @@ class TestAVReaderSync:
         # Use a range to be safe
         audio_list, _ = bbb_av[700:740]
         combined = np.concatenate([a.asnumpy() for a in audio_list], axis=1)
-        assert np.any(combined != 0)
+        assert combined.any()
 
 
 # ---------------------------------------------------------------------------
@@ -138,18 +140,16 @@ class TestAVReaderSync:
 # ---------------------------------------------------------------------------
 
 class TestAVReaderBytesIO:
-    def test_read_from_bytes_io(self):
-        with open(BBB_PATH, 'rb') as f:
-            av = AVReader(f, ctx=CTX)
-            assert len(av) == 1440
-
-    def test_bytes_io_matches_file(self, bbb_av):
-        with open(BBB_PATH, 'rb') as f:
-            av_bio = AVReader(f, ctx=CTX)
-            audio1, video1 = bbb_av[50]
-            audio2, video2 = av_bio[50]
-            assert np.allclose(audio1.asnumpy(), audio2.asnumpy())
-            assert np.allclose(video1.asnumpy(), video2.asnumpy())
+    def test_read_from_bytes_io(self, bbb_bytes):
+        av = AVReader(io.BytesIO(bbb_bytes), ctx=CTX)
+        assert len(av) == 1440
+
+    def test_bytes_io_matches_file(self, bbb_av, bbb_bytes):
+        av_bio = AVReader(io.BytesIO(bbb_bytes), ctx=CTX)
+        audio1, video1 = bbb_av[50]
+        audio2, video2 = av_bio[50]
+        assert np.allclose(audio1.asnumpy(), audio2.asnumpy())
+        assert np.allclose(video1.asnumpy(), video2.asnumpy())
 
 
 # ---------------------------------------------------------------------------
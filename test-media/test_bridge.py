@@ -3,11 +3,8 @@ import numpy as np
 import pytest
 
 import decord
-from decord import VideoReader, cpu
 from decord.bridge import set_bridge, reset_bridge
 
-from conftest import BBB_PATH, CTX
-
 
 def _torch_available():
     try:
@@ -22,21 +19,18 @@ def _torch_available():
 # ---------------------------------------------------------------------------
 
 class TestNativeBridge:
-    def test_default_returns_decord_ndarray(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX)
-        frame = vr[0]
+    def test_default_returns_decord_ndarray(self, bbb_video):
+        frame = bbb_video[0]
         assert isinstance(frame, decord.nd.NDArray)
 
-    def test_ndarray_to_numpy(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX)
-        frame = vr[0]
+    def test_ndarray_to_numpy(self, bbb_video):
+        frame = bbb_video[0]
         arr = frame.asnumpy()
         assert isinstance(arr, np.ndarray)
         assert arr.dtype == np.uint8
 
-    def test_ndarray_shape(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX)
-        frame = vr[0]
+    def test_ndarray_shape(self, bbb_video):
+        frame = bbb_video[0]
         assert frame.shape == (360, 640, 3)
 
 
@@ -54,35 +48,32 @@ class TestTorchBridge:
         not _torch_available(),
         reason="PyTorch not installed"
     )
-    def test_torch_bridge_returns_tensor(self):
+    def test_torch_bridge_returns_tensor(self, bbb_video):
         import torch
-        vr = VideoReader(BBB_PATH, ctx=CTX)
         set_bridge('torch')
-        frame = vr[0]
+        frame = bbb_video[0]
         assert isinstance(frame, torch.Tensor)
 
     @pytest.mark.skipif(
         not _torch_available(),
         reason="PyTorch not installed"
     )
-    def test_torch_bridge_shape(self):
+    def test_torch_bridge_shape(self, bbb_video):
         import torch
-        vr = VideoReader(BBB_PATH, ctx=CTX)
         set_bridge('torch')
-        frame = vr[0]
+        frame = bbb_video[0]
         assert frame.shape == (360, 640, 3)
 
     @pytest.mark.skipif(
         not _torch_available(),
         reason="PyTorch not installed"
     )
-    def test_torch_bridge_context_manager(self):
+    def test_torch_bridge_context_manager(self, bbb_video):
         import torch
         from decord.bridge import use_torch
-        vr = VideoReader(BBB_PATH, ctx=CTX)
         with use_torch():
-            frame = vr[0]
+            frame = bbb_video[0]
             assert isinstance(frame, torch.Tensor)
         # After context, should be back to native
-        frame2 = vr[0]
+        frame2 = bbb_video[0]
         assert isinstance(frame2, decord.nd.NDArray)
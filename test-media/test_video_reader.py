@@ -8,7 +8,7 @@ import pytest
 from decord import VideoReader, cpu
 from decord.base import DECORDError
 
-from conftest import BBB_PATH, PANCAKE_PATH, CORRUPTED_PATH, ROTATION_VIDEOS, UNORDERED_PATH, CTX
+from conftest import BBB_PATH, PANCAKE_PATH, CORRUPTED_PATH, ROTATION_VIDEOS, CTX
 
 
 # ---------------------------------------------------------------------------
@@ -34,12 +34,12 @@ class TestVideoReaderProperties:
         # First keyframe should be frame 0
         assert keys[0] == 0
         # All indices should be valid
-        for k in keys:
-            assert 0 <= k < len(bbb_video)
+        arr = np.asarray(keys, dtype=np.int64)
+        assert arr.min() >= 0 and arr.max() < len(bbb_video)
 
     def test_key_indices_are_sorted(self, bbb_video):
-        keys = bbb_video.get_key_indices()
-        assert keys == sorted(keys)
+        arr = np.asarray(bbb_video.get_key_indices(), dtype=np.int64)
+        assert np.all(np.diff(arr) >= 0)
 
     def test_pancake_frame_count(self, pancake_video):
         assert len(pancake_video) == 310
@@ -72,9 +72,9 @@ class TestVideoReaderFrameAccess:
             bbb_video[-1441]
 
     def test_pixel_values_in_range(self, bbb_video):
+        # uint8 bounds every pixel to [0, 255]
         frame = bbb_video[100].asnumpy()
-        assert frame.min() >= 0
-        assert frame.max() <= 255
+        assert frame.dtype == np.uint8
 
     def test_different_frames_differ(self, bbb_video):
         """Frames far apart should have different content."""
@@ -89,7 +89,11 @@ class TestVideoReaderFrameAccess:
 
 class TestVideoReaderSequential:
     def test_read_first_30_frames(self, bbb_video):
-        for i in range(30):
+        frames = bbb_video[:30]
+        assert frames.shape == (30, 360, 640, 3)
+
+    def test_read_first_frames_individual(self, bbb_video):
+        for i in range(10):
             frame = bbb_video[i]
             assert frame.shape == (360, 640, 3)
 
@@ -110,25 +114,17 @@ class TestVideoReaderSlice:
         frames = pancake_video[:]
         assert frames.shape[0] == 310
 
-    def test_slice_range(self, bbb_video):
-        frames = bbb_video[10:20]
-        assert frames.shape == (10, 360, 640, 3)
-
-    def test_slice_with_step(self, bbb_video):
-        frames = bbb_video[0:100:10]
-        assert frames.shape[0] == 10
-
-    def test_slice_from_start(self, bbb_video):
-        frames = bbb_video[:5]
-        assert frames.shape[0] == 5
-
-    def test_slice_to_end(self, bbb_video):
-        frames = bbb_video[1435:]
-        assert frames.shape[0] == 5
-
-    def test_slice_negative(self, bbb_video):
-        frames = bbb_video[-5:]
-        assert frames.shape[0] == 5
+    # Ordered by start frame so consecutive cases stay close to the decoder position
+    @pytest.mark.parametrize('sl, n', [
+        (slice(None, 5), 5),
+        (slice(0, 100, 10), 10),
+        (slice(10, 20), 10),
+        (slice(1435, None), 5),
+        (slice(-5, None), 5),
+    ], ids=['from_start', 'with_step', 'range', 'to_end', 'negative'])
+    def test_slice_variants(self, bbb_video, sl, n):
+        frames = bbb_video[sl]
+        assert frames.shape == (n, 360, 640, 3)
 
 
 # ---------------------------------------------------------------------------
@@ -143,10 +139,20 @@ class TestVideoReaderBatch:
 
     def test_get_batch_random(self, bbb_video):
         random.seed(42)
-        indices = random.sample(range(1440), 20)
+        indices = sorted(random.sample(range(1440), 20))
         frames = bbb_video.get_batch(indices)
         assert frames.shape == (20, 360, 640, 3)
 
+    def test_get_batch_random_unsorted(self, bbb_video):
+        """Out-of-order indices force backward seeks but must still return frames in request order."""
+        random.seed(42)
+        indices = random.sample(range(1440), 5)
+        frames = bbb_video.get_batch(indices).asnumpy()
+        assert frames.shape == (5, 360, 640, 3)
+        expected = bbb_video.get_batch(sorted(indices)).asnumpy()
+        order = np.argsort(indices)
+        assert np.array_equal(frames[order], expected)
+
     def test_get_batch_single(self, bbb_video):
         frames = bbb_video.get_batch([500])
         assert frames.shape == (1, 360, 640, 3)
@@ -177,30 +183,30 @@ class TestVideoReaderBatch:
 # ---------------------------------------------------------------------------
 
 class TestVideoReaderSeeking:
-    def test_seek(self, bbb_video):
-        bbb_video.seek(100)
-        frame = bbb_video.next()
+    def test_seek(self, bbb_video_mutable):
+        bbb_video_mutable.seek(100)
+        frame = bbb_video_mutable.next()
         assert frame.shape == (360, 640, 3)
 
-    def test_seek_accurate(self, bbb_video):
-        bbb_video.seek_accurate(100)
-        frame = bbb_video.next()
+    def test_seek_accurate(self, bbb_video_mutable):
+        bbb_video_mutable.seek_accurate(100)
+        frame = bbb_video_mutable.next()
         assert frame.shape == (360, 640, 3)
 
-    def test_seek_to_start(self, bbb_video):
-        bbb_video.seek(0)
-        frame = bbb_video.next()
+    def test_seek_to_start(self, bbb_video_mutable):
+        bbb_video_mutable.seek(0)
+        frame = bbb_video_mutable.next()
         assert frame.shape == (360, 640, 3)
 
-    def test_seek_to_near_end(self, bbb_video):
-        bbb_video.seek_accurate(1439)
-        frame = bbb_video.next()
+    def test_seek_to_near_end(self, bbb_video_mutable):
+        bbb_video_mutable.seek_accurate(1439)
+        frame = bbb_video_mutable.next()
         assert frame.shape == (360, 640, 3)
 
-    def test_skip_frames(self, bbb_video):
-        bbb_video.seek(0)
-        bbb_video.skip_frames(5)
-        frame = bbb_video.next()
+    def test_skip_frames(self, bbb_video_mutable):
+        bbb_video_mutable.seek(0)
+        bbb_video_mutable.skip_frames(5)
+        frame = bbb_video_mutable.next()
         assert frame.shape == (360, 640, 3)
 
 
@@ -219,17 +225,14 @@ class TestVideoReaderTimestamps:
 
     def test_timestamps_are_monotonic(self, bbb_video):
         ts = bbb_video.get_frame_timestamp(range(100))
-        starts = ts[:, 0]
-        assert all(starts[i] <= starts[i + 1] for i in range(len(starts) - 1))
+        assert np.all(np.diff(ts[:, 0]) >= 0)
 
     def test_timestamps_match_fps(self, bbb_video):
         """Frame interval should roughly match 1/fps."""
         ts = bbb_video.get_frame_timestamp(range(10))
         fps = bbb_video.get_avg_fps()
         expected_interval = 1.0 / fps
-        for i in range(1, 10):
-            actual_interval = ts[i, 0] - ts[i - 1, 0]
-            assert actual_interval == pytest.approx(expected_interval, rel=0.1)
+        assert np.allclose(np.diff(ts[:, 0]), expected_interval, rtol=0.1, atol=0)
 
     def test_last_frame_timestamp_reasonable(self, bbb_video):
         ts = bbb_video.get_frame_timestamp([1439])
@@ -242,21 +245,14 @@ class TestVideoReaderTimestamps:
 # ---------------------------------------------------------------------------
 
 class TestVideoReaderResize:
-    def test_resize(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX, width=320, height=180)
-        frame = vr[0]
-        assert frame.shape == (180, 320, 3)
-
-    def test_resize_width_only(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX, width=320)
-        frame = vr[0]
-        assert frame.shape[2] == 3
-        assert frame.shape[1] == 320
-
-    def test_resize_height_only(self):
-        vr = VideoReader(BBB_PATH, ctx=CTX, height=180)
-        frame = vr[0]
-        assert frame.shape[0] == 180
+    @pytest.mark.parametrize('width, height, shape', [
+        (320, 180, (180, 320, 3)),
+        (320, -1, (360, 320, 3)),
+        (-1, 180, (180, 640, 3)),
+    ], ids=['both', 'width_only', 'height_only'])
+    def test_resize(self, width, height, shape):
+        vr = VideoReader(BBB_PATH, ctx=CTX, width=width, height=height)
+        assert vr[0].shape == shape
 
 
 # ---------------------------------------------------------------------------
@@ -264,17 +260,15 @@ class TestVideoReaderResize:
 # ---------------------------------------------------------------------------
 
 class TestVideoReaderBytesIO:
-    def test_read_from_bytes_io(self):
-        with open(BBB_PATH, 'rb') as f:
-            vr = VideoReader(f, ctx=CTX)
-            assert len(vr) == 1440
+    def test_read_from_bytes_io(self, bbb_bytes):
+        vr = VideoReader(io.BytesIO(bbb_bytes), ctx=CTX)
+        assert len(vr) == 1440
 
-    def test_bytes_io_matches_file(self, bbb_video):
-        with open(BBB_PATH, 'rb') as f:
-            vr_bio = VideoReader(f, ctx=CTX)
-            frame_file = bbb_video[50].asnumpy().astype('float')
-            frame_bio = vr_bio[50].asnumpy().astype('float')
-            assert np.mean(np.abs(frame_file - frame_bio)) < 2
+    def test_bytes_io_matches_file(self, bbb_video, bbb_bytes):
+        vr_bio = VideoReader(io.BytesIO(bbb_bytes), ctx=CTX)
+        frame_file = bbb_video[50].asnumpy().astype(np.int16)
+        frame_bio = vr_bio[50].asnumpy().astype(np.int16)
+        assert np.mean(np.abs(frame_file - frame_bio)) < 2
 
 
 # ---------------------------------------------------------------------------
@@ -282,25 +276,16 @@ class TestVideoReaderBytesIO:
 # ---------------------------------------------------------------------------
 
 class TestVideoReaderRotation:
-    def test_landscape_no_rotation(self):
-        vr = VideoReader(ROTATION_VIDEOS[0], ctx=CTX)
-        assert vr[0].shape == (320, 568, 3)
-
-    def test_landscape_180_rotation(self):
-        vr = VideoReader(ROTATION_VIDEOS[180], ctx=CTX)
-        assert vr[0].shape == (320, 568, 3)
-
-    def test_portrait_90_rotation(self):
-        vr = VideoReader(ROTATION_VIDEOS[90], ctx=CTX)
-        assert vr[0].shape == (568, 320, 3)
-
-    def test_portrait_270_rotation(self):
-        vr = VideoReader(ROTATION_VIDEOS[270], ctx=CTX)
-        assert vr[0].shape == (568, 320, 3)
-
-    def test_rotated_with_resize(self):
-        vr = VideoReader(ROTATION_VIDEOS[90], ctx=CTX, height=300, width=200)
-        assert vr[0].shape == (300, 200, 3)
+    @pytest.mark.parametrize('rot, width, height, shape', [
+        (0, -1, -1, (320, 568, 3)),
+        (180, -1, -1, (320, 568, 3)),
+        (90, -1, -1, (568, 320, 3)),
+        (270, -1, -1, (568, 320, 3)),
+        (90, 200, 300, (300, 200, 3)),
+    ], ids=['landscape_0', 'landscape_180', 'portrait_90', 'portrait_270', 'portrait_90_resized'])
+    def test_rotation(self, rot, width, height, shape):
+        vr = VideoReader(ROTATION_VIDEOS[rot], ctx=CTX, width=width, height=height)
+        assert vr[0].shape == shape
 
 
 # ---------------------------------------------------------------------------
@@ -319,15 +304,12 @@ class TestVideoReaderCorrupted:
 # ---------------------------------------------------------------------------
 
 class TestVideoReaderUnorderedPTS:
-    def test_unordered_timestamps_sorted(self):
-        vr = VideoReader(UNORDERED_PATH, ctx=CTX)
-        ts = vr.get_frame_timestamp(range(4))
-        starts = ts[:, 0]
-        assert all(starts[i] <= starts[i + 1] for i in range(len(starts) - 1))
-
-    def test_unordered_timestamps_values(self):
-        vr = VideoReader(UNORDERED_PATH, ctx=CTX)
-        ts = vr.get_frame_timestamp(range(4))
+    def test_unordered_timestamps_sorted(self, unordered_video):
+        ts = unordered_video.get_frame_timestamp(range(4))
+        assert np.all(np.diff(ts[:, 0]) >= 0)
+
+    def test_unordered_timestamps_values(self, unordered_video):
+        ts = unordered_video.get_frame_timestamp(range(4))
         assert np.allclose(ts[:, 0], [0.0, 0.03125, 0.0625, 0.09375])
 
 
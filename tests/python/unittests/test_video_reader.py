@@ -6,18 +6,24 @@ from decord.base import DECORDError
 
 CTX = cpu(0)
 
+_TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'test_data'))
+_DEFAULT_VIDEO_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'examples', 'flipping_a_pancake.mkv'))
+_CORRUPTED_VIDEO_PATH = os.path.join(_TEST_DATA_DIR, 'corrupted.mp4')
+_ROTATED_VIDEO_PATHS = {rot: os.path.join(_TEST_DATA_DIR, f'video_{rot}.mov') for rot in [0, 90, 180, 270]}
+_UNORDERED_VIDEO_PATH = os.path.join(_TEST_DATA_DIR, 'unordered.mov')
+
 def _get_default_test_video(ctx=CTX):
-    return VideoReader(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'examples', 'flipping_a_pancake.mkv')), ctx=ctx)
+    return VideoReader(_DEFAULT_VIDEO_PATH, ctx=ctx)
 
 def _get_corrupted_test_video(ctx=CTX):
-    return VideoReader(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'test_data', 'corrupted.mp4')), ctx=ctx)
+    return VideoReader(_CORRUPTED_VIDEO_PATH, ctx=ctx)
 
 def _get_rotated_test_video(rot, height=-1, width=-1, ctx=CTX):
-    return VideoReader(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'test_data', f'video_{rot}.mov')), height=height, width=width, ctx=ctx)
+    return VideoReader(_ROTATED_VIDEO_PATHS[rot], height=height, width=width, ctx=ctx)
 
 def _get_unordered_test_video(ctx=CTX):
     # video with frames not ordered by pts
-    return VideoReader(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'test_data', 'unordered.mov')), ctx=ctx)
+    return VideoReader(_UNORDERED_VIDEO_PATH, ctx=ctx)
 
 def test_video_reader_len():
     vr = _get_default_test_video()
@@ -95,8 +101,7 @@ def test_frame_timestamps():
     assert np.allclose(frame_ts[:,0], [0.0, 0.03125, 0.0625, 0.09375]), frame_ts[:,0]
 
 def test_bytes_io():
-    fn = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'examples', 'flipping_a_pancake.mkv'))
-    with open(fn, 'rb') as f:
+    with open(_DEFAULT_VIDEO_PATH, 'rb') as f:
         vr = VideoReader(f)
         assert len(vr) == 310
         vr2 = _get_default_test_video()